@@ -34,7 +34,7 @@ root_agent = Agent(
     
     ## Email operations
     You can perform email operations directly using these tools:
-    - `list_emails`: Show emails from your inbox or other labels
+    - `list_emails`: Show emails from your inbox or other labels (pass include_body=False when only senders, subjects or snippets are needed)
     - `read_email`: Read the full content of a specific email
     - `send_email`: Send a new email to specified recipients
     - `delete_email`: Delete or move an email to trash
@@ -4,21 +4,52 @@
 Calendar, Email, and GitHub tools for integration.
 """
 
-# Calendar tools
-from .calendar_utils import get_current_time
-from .create_event import create_event
-from .delete_event import delete_event
-from .edit_event import edit_event
-from .list_events import list_events
-
-# Email tools
-from .delete_email import delete_email
-from .list_emails import list_emails
-from .read_email import read_email
-from .send_email import send_email
-
-# GitHub tools
-from .github_tools import list_repositories, create_repository, scan_repository, push_to_repository
+import importlib
+
+# Tools are imported on first access (PEP 562) so that loading the package
+# does not pull in the Google API client and requests for unused tools
+_LAZY = {
+    # Calendar tools
+    "get_current_time": "calendar_utils",
+    "create_event": "create_event",
+    "delete_event": "delete_event",
+    "edit_event": "edit_event",
+    "list_events": "list_events",
+    # Email tools
+    "delete_email": "delete_email",
+    "list_emails": "list_emails",
+    "alist_emails": "list_emails",
+    "read_email": "read_email",
+    "send_email": "send_email",
+    "send_emails": "send_email",
+    # GitHub tools
+    "list_repositories": "github_tools",
+    "alist_repositories": "github_tools",
+    "create_repository": "github_tools",
+    "scan_repository": "github_tools",
+    "ascan_repository": "github_tools",
+    "push_to_repository": "github_tools",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name = _LAZY[name]
+    module = importlib.import_module(f".{module_name}", __name__)
+
+    # Bind every tool from the module, replacing the submodule attribute
+    # that the import set on this package when it shares a tool's name
+    for tool, source in _LAZY.items():
+        if source == module_name:
+            globals()[tool] = getattr(module, tool)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Calendar tools
@@ -32,9 +63,14 @@ __all__ = [
     "list_emails",
     "read_email",
     "send_email",
+    "send_emails",
     # GitHub tools
     "list_repositories",
     "create_repository",
     "scan_repository",
     "push_to_repository",
+    # Async variants
+    "alist_emails",
+    "alist_repositories",
+    "ascan_repository",
 ]
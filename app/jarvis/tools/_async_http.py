@@ -0,0 +1,81 @@
+"""Shared aiohttp sessions for the async tool variants."""
+
+import asyncio
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+
+# One session per event loop, shared by Gmail and GitHub requests on that loop
+_SESSIONS = weakref.WeakKeyDictionary()
+_SESSIONS_LOCK = threading.Lock()
+
+
+async def get_session():
+    """
+    Get the shared client session for the running event loop.
+
+    Each event loop gets its own session, so loops in other threads (e.g.
+    run_sync from a worker thread) never replace or close it.
+
+    Returns:
+        aiohttp.ClientSession: The shared session
+    """
+    loop = asyncio.get_running_loop()
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=128, limit_per_host=64, ttl_dns_cache=300
+                )
+            )
+            _SESSIONS[loop] = session
+    return session
+
+
+async def close_session():
+    """Close the shared session of the running event loop, if any."""
+    loop = asyncio.get_running_loop()
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.pop(loop, None)
+    if session is not None:
+        await session.close()
+
+
+def loop_running():
+    """Return True if called from inside a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def run_sync(coro):
+    """
+    Run a coroutine from synchronous code on a fresh event loop.
+
+    When called from inside a running event loop (e.g. a sync tool invoked
+    by the agent server), the coroutine runs on a worker thread with its own
+    loop so the caller's loop is not re-entered. The session created for
+    that loop is closed before returning.
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await close_session()
+
+    if not loop_running():
+        return asyncio.run(runner())
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, runner()).result()
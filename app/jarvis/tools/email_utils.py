@@ -1,17 +1,25 @@
 """Utility functions for Gmail integration."""
 
-import json
 import os
 import base64
+import codecs
+from collections import OrderedDict
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from pathlib import Path
 
+import requests
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 
+try:
+    import html2text
+except ImportError:  # HTML-only bodies are returned as-is
+    html2text = None
+
+from .json_utils import loads
+
 # Define scopes needed for Gmail
 SCOPES = ["https://www.googleapis.com/auth/gmail.modify"]
 
@@ -19,20 +27,71 @@ SCOPES = ["https://www.googleapis.com/auth/gmail.modify"]
 TOKEN_PATH = Path("~/.credentials/gmail_token.json").expanduser()
 CREDENTIALS_PATH = Path("credentials.json")
 
+# Base URL for direct REST calls
+GMAIL_API_URL = "https://gmail.googleapis.com/gmail/v1/users/me"
 
-def get_gmail_service():
+# Pooled session for direct REST reads
+_REST_SESSION = requests.Session()
+
+# Credentials, service and sender address for the current token file,
+# reused until it changes
+_SERVICE_CACHE = {"mtime": None, "creds": None, "service": None, "sender": None}
+
+# Appended to bodies cut off at max_body_bytes
+TRUNCATED_MARKER = "\n[truncated]"
+
+# Maximum MIME nesting depth searched for a message body
+MAX_PART_DEPTH = 10
+
+
+def _nested_part_fields(depth):
+    fields = "mimeType,body/data"
+    for _ in range(depth - 1):
+        fields = f"mimeType,body/data,parts({fields})"
+    return fields
+
+
+# Partial response covering everything format_message reads, so attachment
+# data and unused metadata are never downloaded. Parts are requested as deep
+# as the body search goes, so no body within MAX_PART_DEPTH is missed.
+MESSAGE_FIELDS = (
+    "id,threadId,historyId,snippet,"
+    f"payload(headers,mimeType,body/data,parts({_nested_part_fields(MAX_PART_DEPTH)}))"
+)
+
+# Partial response for listings without bodies
+HEADER_FIELDS = "id,threadId,historyId,snippet,payload/headers"
+
+# Formatted messages keyed by (id, historyId, include_body, max_body_bytes, fields)
+_FORMAT_CACHE = OrderedDict()
+_FORMAT_CACHE_SIZE = 512
+
+
+def _token_mtime():
+    try:
+        return TOKEN_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_gmail_credentials():
     """
-    Authenticate and create a Gmail service object.
+    Load, refresh or obtain OAuth credentials for Gmail.
 
     Returns:
-        A Gmail service object or None if authentication fails
+        Valid credentials or None if authentication fails
     """
+    mtime = _token_mtime()
+    cached = _SERVICE_CACHE["creds"]
+    if cached and cached.valid and mtime is not None and _SERVICE_CACHE["mtime"] == mtime:
+        return cached
+
     creds = None
 
     # Check if token exists and is valid
     if TOKEN_PATH.exists():
         creds = Credentials.from_authorized_user_info(
-            json.loads(TOKEN_PATH.read_text()), SCOPES
+            loads(TOKEN_PATH.read_bytes()), SCOPES
         )
 
     # If credentials don't exist or are invalid, refresh or get new ones
@@ -54,8 +113,78 @@ def get_gmail_service():
         TOKEN_PATH.parent.mkdir(parents=True, exist_ok=True)
         TOKEN_PATH.write_text(creds.to_json())
 
-    # Create and return the Gmail service
-    return build("gmail", "v1", credentials=creds)
+    # New credentials invalidate any service and sender from the old ones
+    _SERVICE_CACHE["mtime"] = _token_mtime()
+    _SERVICE_CACHE["creds"] = creds
+    _SERVICE_CACHE["service"] = None
+    _SERVICE_CACHE["sender"] = None
+    return creds
+
+
+def get_gmail_service():
+    """
+    Authenticate and create a Gmail service object.
+
+    Returns:
+        A Gmail service object or None if authentication fails
+    """
+    creds = get_gmail_credentials()
+    if not creds:
+        return None
+
+    if _SERVICE_CACHE["service"] is None:
+        # Create the Gmail service from the bundled discovery document
+        _SERVICE_CACHE["service"] = build(
+            "gmail", "v1", credentials=creds, cache_discovery=False, static_discovery=True
+        )
+    return _SERVICE_CACHE["service"]
+
+
+def gmail_rest_get(path, token, params=None):
+    """
+    Call a Gmail read endpoint directly, bypassing the discovery client.
+
+    Args:
+        path: Path relative to the user's API root, e.g. "messages"
+        token: OAuth access token
+        params: Optional query parameters
+
+    Returns:
+        dict: The parsed JSON response
+
+    Raises:
+        requests.HTTPError: If the API returns an error status
+    """
+    response = _REST_SESSION.get(
+        f"{GMAIL_API_URL}/{path}",
+        params=params,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    response.raise_for_status()
+    return loads(response.content)
+
+
+def get_sender_address(service):
+    """
+    Get the email address of the authenticated user.
+
+    The address is cached alongside the cached service and cleared with it,
+    so it is fetched again whenever the token is reloaded.
+
+    Args:
+        service: A Gmail service object
+
+    Returns:
+        str: The user's email address
+    """
+    if service is _SERVICE_CACHE["service"] and _SERVICE_CACHE["sender"]:
+        return _SERVICE_CACHE["sender"]
+
+    profile = service.users().getProfile(userId="me").execute()
+    sender = profile["emailAddress"]
+    if service is _SERVICE_CACHE["service"]:
+        _SERVICE_CACHE["sender"] = sender
+    return sender
 
 
 def create_message(sender, to, subject, message_text, is_html=False):
@@ -72,45 +201,122 @@ def create_message(sender, to, subject, message_text, is_html=False):
     Returns:
         An object containing a base64url encoded email object.
     """
-    message = MIMEMultipart()
+    # A single-part message needs no multipart wrapper
+    message = MIMEText(message_text, 'html' if is_html else 'plain', 'utf-8')
     message['to'] = to
     message['from'] = sender
     message['subject'] = subject
 
-    if is_html:
-        msg = MIMEText(message_text, 'html')
-    else:
-        msg = MIMEText(message_text, 'plain')
-    
-    message.attach(msg)
+    # Gmail accepts unpadded base64url, so the encoded bytes are used as-is
+    return {'raw': base64.urlsafe_b64encode(message.as_bytes()).rstrip(b'=').decode('ascii')}
+
+
+def _decode_body(data, max_body_bytes):
+    """
+    Decode a base64url message body, truncated to max_body_bytes.
+
+    Args:
+        data: The base64url encoded body from the Gmail API
+        max_body_bytes: Maximum number of decoded bytes to keep, or None for
+            no limit
+
+    Returns:
+        str: The decoded body text, ending in TRUNCATED_MARKER if cut off
+    """
+    # Every 4 base64 characters decode to 3 bytes
+    limit = None if max_body_bytes is None else (max_body_bytes // 3) * 4
+    if limit is None or len(data) <= limit:
+        data += "=" * (-len(data) % 4)
+        return base64.urlsafe_b64decode(data.encode("ascii")).decode("utf-8", errors="replace")
 
-    return {'raw': base64.urlsafe_b64encode(message.as_bytes()).decode()}
+    # Drop any multibyte character split by the cut instead of mangling it
+    raw = base64.urlsafe_b64decode(data[:limit].encode("ascii"))
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    return decoder.decode(raw, final=False) + TRUNCATED_MARKER
 
 
-def format_message(message):
+def format_message(message, include_body=True, max_body_bytes=256_000, fields=None):
     """
     Format a message from Gmail API into a readable format.
 
+    Results are cached per message version, so formatting the same message
+    again (e.g. listing and then reading it) skips the MIME walk and decoding.
+
     Args:
         message: A message object from Gmail API
+        include_body: Whether to decode the message body
+        max_body_bytes: Maximum number of body bytes to decode, or None for
+            no limit
+        fields: The partial response fields the message was fetched with, or
+            None for a full message. Each field set is cached separately.
 
     Returns:
         dict: A formatted message with key details
     """
+    key = None
+    if message.get('id') and message.get('historyId'):
+        key = (message['id'], message['historyId'], include_body, max_body_bytes, fields)
+        cached = _FORMAT_CACHE.get(key)
+        if cached is not None:
+            _FORMAT_CACHE.move_to_end(key)
+            return dict(cached)
+
+    formatted = _parse_message(message, include_body, max_body_bytes)
+
+    if key is not None:
+        _FORMAT_CACHE[key] = formatted
+        if len(_FORMAT_CACHE) > _FORMAT_CACHE_SIZE:
+            _FORMAT_CACHE.popitem(last=False)
+    return dict(formatted)
+
+
+def _walk_for_body(payload, max_body_bytes):
+    """
+    Find the message body in a (possibly nested) MIME payload.
+
+    Prefers the first text/plain part, falling back to the first text/html
+    part converted to text.
+
+    Args:
+        payload: The message payload from the Gmail API
+        max_body_bytes: Maximum number of body bytes to decode
+
+    Returns:
+        str: The decoded body text
+    """
+    html_data = None
+    stack = [(payload, 0)]
+    while stack:
+        part, depth = stack.pop()
+        mime_type = part.get('mimeType', '')
+        data = part.get('body', {}).get('data')
+
+        if mime_type == 'text/plain' and data:
+            return _decode_body(data, max_body_bytes)
+        if mime_type == 'text/html' and data and html_data is None:
+            html_data = data
+
+        if depth < MAX_PART_DEPTH:
+            # Push in reverse so parts are visited in document order
+            for child in reversed(part.get('parts', [])):
+                stack.append((child, depth + 1))
+
+    if html_data is None:
+        return ""
+    html = _decode_body(html_data, max_body_bytes)
+    return html2text.html2text(html) if html2text else html
+
+
+def _parse_message(message, include_body, max_body_bytes):
+    """Extract headers and body from a Gmail API message."""
     headers = {}
     for header in message.get('payload', {}).get('headers', []):
         headers[header['name'].lower()] = header['value']
     
-    # Extract message body (simplified - in real implementation, would need to handle multipart)
     body = ""
     try:
-        if 'parts' in message.get('payload', {}):
-            for part in message['payload']['parts']:
-                if part['mimeType'] == 'text/plain':
-                    body = base64.urlsafe_b64decode(part['body']['data']).decode()
-                    break
-        elif 'body' in message.get('payload', {}) and 'data' in message['payload']['body']:
-            body = base64.urlsafe_b64decode(message['payload']['body']['data']).decode()
+        if include_body:
+            body = _walk_for_body(message.get('payload', {}), max_body_bytes)
     except Exception:
         body = "[Could not decode message body]"
 
@@ -1,12 +1,252 @@
 """GitHub tools for repository operations."""
 
+import asyncio
 import base64
-import json
+import gzip
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import requests
+from ._async_http import get_session
+from .github_utils import (
+    RATE_LIMIT_RETRIES,
+    conditional_get,
+    defer_requests,
+    github_request,
+    get_github_auth,
+    get_github_headers,
+    rate_limit_action,
+    throttle_delay,
+)
+from .json_utils import dumps, loads
+
+# Number of directories fetched in parallel by a recursive scan
+MAX_SCAN_WORKERS = 8
+
+# Repository listing pagination
+REPOS_URL = "https://api.github.com/user/repos?per_page=100"
+REPOS_PER_PAGE = 100
+MAX_PAGE_REQUESTS = 8
+
+# The contents API lists at most this many entries per directory
+CONTENTS_LISTING_LIMIT = 1000
+
+# Gzip-compress push request bodies. GitHub does not document gzip request
+# bodies, so this is off by default; when enabled, content above
+# GZIP_THRESHOLD bytes is compressed and a rejection is remembered for the
+# rest of the process so later pushes are sent uncompressed.
+GZIP_UPLOADS = False
+GZIP_THRESHOLD = 16_384
+_GZIP_STATE = {"rejected": False}
+
+
+def _format_repository(repo):
+    """Format a single repository from the GitHub API."""
+    return {
+        "id": repo.get("id"),
+        "name": repo.get("name"),
+        "full_name": repo.get("full_name"),
+        "description": repo.get("description"),
+        "url": repo.get("html_url"),
+        "private": repo.get("private"),
+        "created_at": repo.get("created_at"),
+        "updated_at": repo.get("updated_at"),
+        "language": repo.get("language")
+    }
+
+
+def _last_page(link_header):
+    """Get the last page number from a GitHub Link header, if present."""
+    if not link_header:
+        return None
+    match = re.search(r'[?&]page=(\d+)[^>]*>;\s*rel="last"', link_header)
+    return int(match.group(1)) if match else None
+
+
+def _fetch_page(url, headers, page):
+    """Fetch one listing page, raising on API errors."""
+    response, data = conditional_get(f"{url}&page={page}", headers)
+    if data is None:
+        raise RuntimeError(f"GitHub API error: {response.status_code} - {response.text}")
+    return data
+
+
+def _fetch_pages_serial(url, headers, start):
+    """
+    Fetch listing pages one at a time from page start until a short page.
+
+    Returns:
+        list: Items from all fetched pages
+    """
+    items = []
+    page = start
+    while True:
+        data = _fetch_page(url, headers, page)
+        items.extend(data)
+        if len(data) < REPOS_PER_PAGE:
+            return items
+        page += 1
+
+
+def _fetch_remaining_repositories(first_page, link_header, headers):
+    """
+    Fetch all repository pages after the first.
+
+    Pages are fetched concurrently on a thread pool when the Link header
+    gives the last page, and serially otherwise. Either way each request goes
+    through conditional_get, so ETags and rate limit handling apply.
+
+    Returns:
+        list: Repositories from pages 2 onwards
+    """
+    last = _last_page(link_header)
+    if last is None:
+        if len(first_page) < REPOS_PER_PAGE:
+            return []
+        return _fetch_pages_serial(REPOS_URL, headers, 2)
+
+    if last < 2:
+        return []
+    with ThreadPoolExecutor(max_workers=MAX_PAGE_REQUESTS) as executor:
+        pages = executor.map(
+            lambda page: _fetch_page(REPOS_URL, headers, page), range(2, last + 1)
+        )
+        return [repo for data in pages for repo in data]
+
+
+def _format_content(item):
+    """Format a single item from the GitHub contents API."""
+    return {
+        "name": item.get("name"),
+        "path": item.get("path"),
+        "type": item.get("type"),  # file or dir
+        "size": item.get("size"),
+        "url": item.get("html_url")
+    }
+
+
+def _fetch_directory(repo_name, path, headers):
+    """Fetch the listing of a single directory, raising on API errors."""
+    url = f"https://api.github.com/repos/{repo_name}/contents/{path}"
+    response, contents = conditional_get(url, headers)
+    if contents is None:
+        raise RuntimeError(f"GitHub API error: {response.status_code} - {response.text}")
+    return contents
+
+
+def _get_file_sha(repo_name, file_path, headers):
+    """
+    Look up the blob SHA of an existing file from its parent directory listing.
+
+    Directory listings carry each entry's SHA without the file content, so
+    large files are not downloaded just to update them. If the listing fails
+    or may be truncated, the file itself is fetched instead.
+
+    Returns:
+        str: The file's SHA, or None if it does not exist
+    """
+    file_path = file_path.strip("/")
+    directory = file_path.rpartition("/")[0]
+    url = f"https://api.github.com/repos/{repo_name}/contents/{directory}".rstrip("/")
+
+    response, listing = conditional_get(url, headers)
+    if response.status_code == 404:
+        # The parent directory does not exist, so neither does the file
+        return None
+
+    if isinstance(listing, list) and len(listing) < CONTENTS_LISTING_LIMIT:
+        for item in listing:
+            if item.get("path") == file_path and item.get("type") == "file":
+                return item.get("sha")
+        return None
+
+    # Fall back to looking up the file directly
+    response = github_request(
+        "GET", f"https://api.github.com/repos/{repo_name}/contents/{file_path}", headers=headers
+    )
+    if response.status_code == 200:
+        return loads(response.content).get("sha")
+    return None
+
+
+def _put_json(url, headers, data, compress):
+    """
+    PUT a JSON body, gzip-compressing it when requested.
+
+    Falls back to an uncompressed body if the compressed one is rejected.
+
+    Returns:
+        requests.Response: The response
+    """
+    compress = compress and not _GZIP_STATE["rejected"]
+    if compress:
+        response = github_request(
+            "PUT",
+            url,
+            headers={
+                **headers,
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
+            },
+            data=gzip.compress(dumps(data)),
+        )
+        if response.status_code not in (400, 415):
+            return response
+
+    fallback = github_request("PUT", url, headers=headers, json=data)
+    if compress and fallback.status_code in (200, 201):
+        # Only the encoding was at fault; stop compressing
+        _GZIP_STATE["rejected"] = True
+    return fallback
+
+
+def _format_contents(contents):
+    """Format a contents API response, which is a list or a single file."""
+    if isinstance(contents, list):
+        return [_format_content(item) for item in contents]
+    return [_format_content(contents)]
+
+
+def _split_contents(items):
+    """Split formatted contents into files and the paths of subdirectories."""
+    files = [item for item in items if item["type"] != "dir"]
+    subdirs = [item["path"] for item in items if item["type"] == "dir"]
+    return files, subdirs
+
+
+def _next_level(listings, files):
+    """
+    Add the files from one level of directory listings to files.
+
+    Returns:
+        list: Paths of the subdirectories to fetch next
+    """
+    level_files, subdirs = _split_contents(
+        [_format_content(item) for listing in listings for item in listing]
+    )
+    files.extend(level_files)
+    return subdirs
+
+
+def _scan_subdirectories(repo_name, items, headers):
+    """
+    Walk all subdirectories of a listing, one level at a time.
+
+    Each level's directories are fetched concurrently.
 
-from .github_utils import get_github_auth, get_github_headers
+    Returns:
+        list: Formatted files found under the listing
+    """
+    files, pending = _split_contents(items)
+
+    with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as executor:
+        while pending:
+            listings = executor.map(
+                lambda subdir: _fetch_directory(repo_name, subdir, headers), pending
+            )
+            pending = _next_level(listings, files)
+
+    return files
 
 
 def list_repositories() -> dict:
@@ -26,20 +266,15 @@ def list_repositories() -> dict:
             }
 
         # Get list of repositories
-        response = requests.get(
-            "https://api.github.com/user/repos",
-            headers=headers
-        )
+        response, repos = conditional_get(REPOS_URL, headers)
 
-        if response.status_code != 200:
+        if repos is None:
             return {
                 "status": "error",
                 "message": f"GitHub API error: {response.status_code} - {response.text}",
                 "repositories": []
             }
 
-        repos = response.json()
-
         if not repos:
             return {
                 "status": "success",
@@ -47,20 +282,13 @@ def list_repositories() -> dict:
                 "repositories": []
             }
 
+        # Fetch any further pages
+        repos = repos + _fetch_remaining_repositories(
+            repos, response.headers.get("Link"), headers
+        )
+
         # Format repositories for display
-        formatted_repos = []
-        for repo in repos:
-            formatted_repos.append({
-                "id": repo.get("id"),
-                "name": repo.get("name"),
-                "full_name": repo.get("full_name"),
-                "description": repo.get("description"),
-                "url": repo.get("html_url"),
-                "private": repo.get("private"),
-                "created_at": repo.get("created_at"),
-                "updated_at": repo.get("updated_at"),
-                "language": repo.get("language")
-            })
+        formatted_repos = [_format_repository(repo) for repo in repos]
 
         return {
             "status": "success",
@@ -104,7 +332,8 @@ def create_repository(name: str, description: str = "", private: bool = False) -
             "auto_init": True  # Initialize with README
         }
 
-        response = requests.post(
+        response = github_request(
+            "POST",
             "https://api.github.com/user/repos",
             headers=headers,
             json=data
@@ -116,7 +345,7 @@ def create_repository(name: str, description: str = "", private: bool = False) -
                 "message": f"GitHub API error: {response.status_code} - {response.text}"
             }
 
-        repo = response.json()
+        repo = loads(response.content)
         return {
             "status": "success",
             "message": f"Repository '{name}' created successfully.",
@@ -138,13 +367,14 @@ def create_repository(name: str, description: str = "", private: bool = False) -
         }
 
 
-def scan_repository(repo_name: str, path: str = "") -> dict:
+def scan_repository(repo_name: str, path: str = "", recursive: bool = False) -> dict:
     """
     Scan a repository to list files and directories.
 
     Args:
         repo_name (str): Name of the repository (format: username/repo)
         path (str): Path within the repository to scan
+        recursive (bool): If True, return a flat list of all files under the path
 
     Returns:
         dict: Information about repository contents or error details
@@ -163,17 +393,15 @@ def scan_repository(repo_name: str, path: str = "") -> dict:
         if path:
             url += f"/{path}"
 
-        response = requests.get(url, headers=headers)
+        response, contents = conditional_get(url, headers)
 
-        if response.status_code != 200:
+        if contents is None:
             return {
                 "status": "error",
                 "message": f"GitHub API error: {response.status_code} - {response.text}",
                 "contents": []
             }
 
-        contents = response.json()
-
         if not contents:
             return {
                 "status": "success",
@@ -182,25 +410,10 @@ def scan_repository(repo_name: str, path: str = "") -> dict:
             }
 
         # Format contents for display
-        formatted_contents = []
-        if isinstance(contents, list):
-            for item in contents:
-                formatted_contents.append({
-                    "name": item.get("name"),
-                    "path": item.get("path"),
-                    "type": item.get("type"),  # file or dir
-                    "size": item.get("size"),
-                    "url": item.get("html_url")
-                })
-        else:
-            # Single file response
-            formatted_contents.append({
-                "name": contents.get("name"),
-                "path": contents.get("path"),
-                "type": contents.get("type"),
-                "size": contents.get("size"),
-                "url": contents.get("html_url")
-            })
+        formatted_contents = _format_contents(contents)
+
+        if recursive:
+            formatted_contents = _scan_subdirectories(repo_name, formatted_contents, headers)
 
         return {
             "status": "success",
@@ -239,12 +452,7 @@ def push_to_repository(repo_name: str, file_path: str, content: str, commit_mess
 
         # Check if file exists to get the SHA (needed for update)
         url = f"https://api.github.com/repos/{repo_name}/contents/{file_path}"
-        response = requests.get(url, headers=headers)
-        sha = None
-
-        if response.status_code == 200:
-            # File exists, get SHA for update
-            sha = response.json().get("sha")
+        sha = _get_file_sha(repo_name, file_path, headers)
 
         # Prepare data for creating/updating file
         data = {
@@ -256,7 +464,8 @@ def push_to_repository(repo_name: str, file_path: str, content: str, commit_mess
             data["sha"] = sha
 
         # Create or update file
-        response = requests.put(url, headers=headers, json=data)
+        compress = GZIP_UPLOADS and len(content) > GZIP_THRESHOLD
+        response = _put_json(url, headers, data, compress=compress)
 
         if response.status_code not in [200, 201]:
             return {
@@ -264,7 +473,7 @@ def push_to_repository(repo_name: str, file_path: str, content: str, commit_mess
                 "message": f"GitHub API error: {response.status_code} - {response.text}"
             }
 
-        result = response.json()
+        result = loads(response.content)
         return {
             "status": "success",
             "message": f"File '{file_path}' pushed to repository successfully.",
@@ -278,4 +487,211 @@ def push_to_repository(repo_name: str, file_path: str, content: str, commit_mess
         return {
             "status": "error",
             "message": f"Error pushing to repository: {str(e)}"
-        }
\ No newline at end of file
+        }
+
+
+async def _aget_json(url, headers):
+    """
+    GET a GitHub API resource on the shared async session.
+
+    Applies the same rate limit handling as github_request.
+
+    Returns:
+        tuple: (status, text, data, link) where data is the parsed JSON body,
+        or None if the request failed, and link is the Link header
+    """
+    session = await get_session()
+    delay = 1.0
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        pause = throttle_delay()
+        if pause:
+            await asyncio.sleep(pause)
+
+        async with session.get(url, headers=headers) as response:
+            body = await response.read()
+            status = response.status
+            link = response.headers.get("Link")
+            limited, wait = rate_limit_action(status, response.headers, delay)
+
+        if limited and attempt < RATE_LIMIT_RETRIES and wait is not None:
+            await asyncio.sleep(wait)
+            delay *= 2
+            continue
+
+        if not limited and wait:
+            defer_requests(wait)
+        break
+
+    if status != 200:
+        return status, body.decode("utf-8", errors="replace"), None, link
+    return status, None, loads(body), link
+
+
+async def _afetch_directory(repo_name, path, headers):
+    """Fetch the listing of a single directory asynchronously, raising on API errors."""
+    url = f"https://api.github.com/repos/{repo_name}/contents/{path}"
+    status, text, contents, _ = await _aget_json(url, headers)
+    if contents is None:
+        raise RuntimeError(f"GitHub API error: {status} - {text}")
+    return contents
+
+
+async def _ascan_subdirectories(repo_name, items, headers):
+    """
+    Walk all subdirectories of a listing asynchronously, one level at a time.
+
+    Returns:
+        list: Formatted files found under the listing
+    """
+    files, pending = _split_contents(items)
+    sem = asyncio.Semaphore(MAX_SCAN_WORKERS)
+
+    async def fetch(subdir):
+        async with sem:
+            return await _afetch_directory(repo_name, subdir, headers)
+
+    while pending:
+        listings = await asyncio.gather(*(fetch(subdir) for subdir in pending))
+        pending = _next_level(listings, files)
+
+    return files
+
+
+async def _afetch_pages(url, headers, pages):
+    """
+    Fetch listing pages concurrently, a bounded number at a time.
+
+    Returns:
+        list: Items from all pages, in page order
+    """
+    sem = asyncio.Semaphore(MAX_PAGE_REQUESTS)
+
+    async def fetch(page):
+        async with sem:
+            return await _aget_json(f"{url}&page={page}", headers)
+
+    items = []
+    for status, text, data, _ in await asyncio.gather(*(fetch(page) for page in pages)):
+        if data is None:
+            raise RuntimeError(f"GitHub API error: {status} - {text}")
+        items.extend(data)
+    return items
+
+
+async def alist_repositories() -> dict:
+    """
+    List repositories for the authenticated user without blocking the event loop.
+
+    Returns:
+        dict: Information about repositories or error details
+    """
+    try:
+        headers = await asyncio.to_thread(get_github_headers)
+        if not headers:
+            return {
+                "status": "error",
+                "message": "Failed to authenticate with GitHub. Please check credentials.",
+                "repositories": []
+            }
+
+        status, text, repos, link = await _aget_json(REPOS_URL, headers)
+
+        if repos is None:
+            return {
+                "status": "error",
+                "message": f"GitHub API error: {status} - {text}",
+                "repositories": []
+            }
+
+        if not repos:
+            return {
+                "status": "success",
+                "message": "No repositories found.",
+                "repositories": []
+            }
+
+        # Fetch any further pages
+        last = _last_page(link)
+        if last is not None and last >= 2:
+            repos += await _afetch_pages(REPOS_URL, headers, range(2, last + 1))
+        elif last is None and len(repos) == REPOS_PER_PAGE:
+            repos += await asyncio.to_thread(
+                _fetch_pages_serial, REPOS_URL, headers, 2
+            )
+
+        formatted_repos = [_format_repository(repo) for repo in repos]
+
+        return {
+            "status": "success",
+            "message": f"Found {len(formatted_repos)} repositories.",
+            "repositories": formatted_repos
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error listing repositories: {str(e)}",
+            "repositories": []
+        }
+
+
+async def ascan_repository(repo_name: str, path: str = "", recursive: bool = False) -> dict:
+    """
+    Scan a repository without blocking the event loop.
+
+    Args:
+        repo_name (str): Name of the repository (format: username/repo)
+        path (str): Path within the repository to scan
+        recursive (bool): If True, return a flat list of all files under the path
+
+    Returns:
+        dict: Information about repository contents or error details
+    """
+    try:
+        headers = await asyncio.to_thread(get_github_headers)
+        if not headers:
+            return {
+                "status": "error",
+                "message": "Failed to authenticate with GitHub. Please check credentials.",
+                "contents": []
+            }
+
+        url = f"https://api.github.com/repos/{repo_name}/contents"
+        if path:
+            url += f"/{path}"
+
+        status, text, contents, _ = await _aget_json(url, headers)
+
+        if contents is None:
+            return {
+                "status": "error",
+                "message": f"GitHub API error: {status} - {text}",
+                "contents": []
+            }
+
+        if not contents:
+            return {
+                "status": "success",
+                "message": "No contents found.",
+                "contents": []
+            }
+
+        formatted_contents = _format_contents(contents)
+
+        if recursive:
+            formatted_contents = await _ascan_subdirectories(
+                repo_name, formatted_contents, headers
+            )
+
+        return {
+            "status": "success",
+            "message": f"Found {len(formatted_contents)} items in repository.",
+            "contents": formatted_contents
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error scanning repository: {str(e)}",
+            "contents": []
+        }
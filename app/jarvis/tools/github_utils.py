@@ -1,15 +1,194 @@
 """Utility functions for GitHub integration."""
 
-import json
 import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
+from .http_utils import parse_retry_after
+from .json_utils import loads
 
 # Path for token storage
 TOKEN_PATH = Path(os.path.expanduser("~/.credentials/github_token.json"))
 
+# Parsed credentials and headers, reused until the token file changes
+_HEADER_CACHE = {"mtime": None, "auth": None, "headers": None}
+_CACHE_LOCK = threading.Lock()
+
+# Shared session so connections to api.github.com are pooled and kept alive.
+# The adapter only retries transient server errors; rate limit responses are
+# left to github_request so there is a single rate limit policy.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503],
+            raise_on_status=False,
+        ),
+    ),
+)
+
+# ETag and parsed body of recent GET responses, keyed by (url, Authorization)
+_ETAG_CACHE = OrderedDict()
+_ETAG_CACHE_SIZE = 256
+_ETAG_LOCK = threading.Lock()
+
+# Rate limit handling
+RATE_LIMIT_THRESHOLD = 5
+RATE_LIMIT_RETRIES = 3
+MAX_RATE_LIMIT_SLEEP = 60
+
+# Time before which no further requests are sent, set when few requests
+# remain in the current rate limit window
+_THROTTLE = {"until": 0.0}
+_THROTTLE_LOCK = threading.Lock()
+
+
+def _seconds_until_reset(headers):
+    reset = headers.get("X-RateLimit-Reset")
+    if not reset:
+        return None
+    return max(0.0, int(reset) - time.time())
+
+
+def throttle_delay():
+    """Get the number of seconds to wait before sending the next request."""
+    with _THROTTLE_LOCK:
+        return max(0.0, _THROTTLE["until"] - time.time())
+
+
+def defer_requests(wait):
+    """Hold back further requests for wait seconds."""
+    with _THROTTLE_LOCK:
+        _THROTTLE["until"] = max(_THROTTLE["until"], time.time() + wait)
+
+
+def rate_limit_action(status_code, headers, delay):
+    """
+    Work out how to react to GitHub's rate limit headers on a response.
+
+    Args:
+        status_code: The response status
+        headers: The response headers
+        delay: Current backoff delay in seconds
+
+    Returns:
+        tuple: (limited, wait) where limited is True if the request was
+        rejected for exceeding a rate limit, and wait is the number of seconds
+        to wait before retrying (or, if not limited, before the next request),
+        or None if that would exceed MAX_RATE_LIMIT_SLEEP
+    """
+    retry_after = headers.get("Retry-After")
+    remaining = headers.get("X-RateLimit-Remaining")
+    limited = status_code in (403, 429) and (
+        retry_after is not None or remaining == "0"
+    )
+
+    if limited:
+        if retry_after is not None:
+            wait = parse_retry_after(retry_after, delay)
+        else:
+            wait = _seconds_until_reset(headers) or delay
+        wait = max(wait, delay)
+    elif remaining is not None and int(remaining) < RATE_LIMIT_THRESHOLD:
+        wait = _seconds_until_reset(headers) or 0
+    else:
+        wait = 0
+
+    return limited, wait if wait <= MAX_RATE_LIMIT_SLEEP else None
+
+
+def github_request(method, url, **kwargs):
+    """
+    Send a GitHub API request, throttling on rate limit headers.
+
+    When few requests remain, the next request (not this one) waits until
+    the rate limit window resets. Requests GitHub rejects for exceeding its
+    primary or secondary rate limits are retried with exponential backoff.
+    Waits longer than MAX_RATE_LIMIT_SLEEP are not attempted; the response
+    is returned as-is.
+
+    Returns:
+        requests.Response: The final response
+    """
+    delay = 1.0
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        pause = throttle_delay()
+        if pause:
+            time.sleep(pause)
+
+        response = SESSION.request(method, url, **kwargs)
+        limited, wait = rate_limit_action(response.status_code, response.headers, delay)
+
+        # Retry rejected requests, but fail fast rather than block the tool
+        # call for a distant reset
+        if limited and attempt < RATE_LIMIT_RETRIES and wait is not None:
+            time.sleep(wait)
+            delay *= 2
+            continue
+
+        if not limited and wait:
+            # Return this response now and slow down the next request instead
+            defer_requests(wait)
+
+        return response
+
+
+def conditional_get(url, headers):
+    """
+    GET a GitHub API resource, revalidating any cached copy with its ETag.
+
+    Unchanged resources come back as 304 Not Modified, which does not count
+    against the rate limit, and the cached body is returned instead.
+
+    Args:
+        url: The API URL
+        headers: Headers for the request
+
+    Returns:
+        tuple: (response, data) where data is the parsed JSON body, or None
+        if the request failed
+    """
+    key = (url, headers.get("Authorization"))
+    with _ETAG_LOCK:
+        cached = _ETAG_CACHE.get(key)
+
+    request_headers = dict(headers)
+    if cached:
+        request_headers["If-None-Match"] = cached[0]
+
+    response = github_request("GET", url, headers=request_headers)
+
+    if response.status_code == 304 and cached:
+        with _ETAG_LOCK:
+            if key in _ETAG_CACHE:
+                _ETAG_CACHE.move_to_end(key)
+        return response, cached[1]
+
+    if response.status_code != 200:
+        return response, None
+
+    data = loads(response.content)
+    etag = response.headers.get("ETag")
+    if etag:
+        with _ETAG_LOCK:
+            _ETAG_CACHE[key] = (etag, data)
+            _ETAG_CACHE.move_to_end(key)
+            if len(_ETAG_CACHE) > _ETAG_CACHE_SIZE:
+                _ETAG_CACHE.popitem(last=False)
+    return response, data
+
 
 def get_github_auth():
     """
@@ -20,8 +199,17 @@ def get_github_auth():
     """
     try:
         if TOKEN_PATH.exists():
-            credentials = json.loads(TOKEN_PATH.read_text())
-            return credentials.get("username"), credentials.get("token")
+            mtime = TOKEN_PATH.stat().st_mtime_ns
+            with _CACHE_LOCK:
+                if _HEADER_CACHE["auth"] and _HEADER_CACHE["mtime"] == mtime:
+                    return _HEADER_CACHE["auth"]
+
+                credentials = loads(TOKEN_PATH.read_bytes())
+                username, token = credentials.get("username"), credentials.get("token")
+                _HEADER_CACHE["mtime"] = mtime
+                _HEADER_CACHE["auth"] = (username, token)
+                _HEADER_CACHE["headers"] = None
+                return username, token
         else:
             print(f"Error: {TOKEN_PATH} not found. Please run setup_github_auth.py first.")
             return None, None
@@ -41,10 +229,14 @@ def get_github_headers():
     if not username or not token:
         return None
 
-    return {
-        "Accept": "application/vnd.github.v3+json",
-        "Authorization": f"token {token}"
-    }
+    with _CACHE_LOCK:
+        if _HEADER_CACHE["headers"] is None:
+            _HEADER_CACHE["headers"] = {
+                "Accept": "application/vnd.github.v3+json",
+                "Authorization": f"token {token}"
+            }
+        # Return a copy so callers can add per-request headers safely
+        return dict(_HEADER_CACHE["headers"])
 
 
 def test_github_connection():
@@ -62,17 +254,19 @@ def test_github_connection():
         }
 
     try:
-        response = requests.get(
+        response = github_request(
+            "GET",
             "https://api.github.com/user",
             auth=HTTPBasicAuth(username, token),
             headers={"Accept": "application/vnd.github.v3+json"}
         )
 
         if response.status_code == 200:
+            user = loads(response.content)
             return {
                 "status": "success",
-                "message": f"Connected to GitHub as {response.json()['login']}",
-                "user": response.json()
+                "message": f"Connected to GitHub as {user['login']}",
+                "user": user
             }
         else:
             return {
@@ -0,0 +1,27 @@
+"""HTTP helpers shared by the Gmail and GitHub tools."""
+
+import time
+from email.utils import parsedate_to_datetime
+
+
+def parse_retry_after(value, default):
+    """
+    Parse a Retry-After header into a number of seconds.
+
+    Args:
+        value: The header value, either delay-seconds or an HTTP-date
+        default: Seconds to use if the header is missing or malformed
+
+    Returns:
+        float: Seconds to wait, never negative
+    """
+    if value is None:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
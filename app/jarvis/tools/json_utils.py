@@ -0,0 +1,38 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library
+    orjson = None
+
+
+def loads(data):
+    """
+    Parse JSON from bytes or str.
+
+    Args:
+        data: The JSON document
+
+    Returns:
+        The parsed object
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj):
+    """
+    Serialize an object to JSON.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document
+    """
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
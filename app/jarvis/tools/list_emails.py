@@ -1,12 +1,107 @@
 """List emails tool for Gmail integration."""
 
-from .email_utils import get_gmail_service, format_message
+import asyncio
+
+import requests
+
+from ._async_http import get_session, run_sync
+from .email_utils import (
+    GMAIL_API_URL,
+    HEADER_FIELDS,
+    MESSAGE_FIELDS,
+    get_gmail_credentials,
+    get_gmail_service,
+    gmail_rest_get,
+    format_message,
+)
+from .http_utils import parse_retry_after
+from .json_utils import loads
+
+# Gmail accepts at most 100 calls in a single batch request
+BATCH_SIZE = 100
+
+# Concurrent fetch settings (kept low to stay under Gmail per-user QPS)
+MESSAGE_URL = GMAIL_API_URL + "/messages/{id}"
+MAX_CONCURRENT_REQUESTS = 16
+MAX_RETRIES = 5
+CONCURRENT_THRESHOLD = 4
+
+
+async def _fetch_message(session, sem, message_id, token, fields):
+    """
+    Fetch a single full message, backing off on rate limit responses.
+
+    Returns:
+        dict: The raw message or None if it could not be fetched
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    delay = 1.0
+    for _ in range(MAX_RETRIES):
+        async with sem:
+            async with session.get(
+                MESSAGE_URL.format(id=message_id),
+                params={"format": "full", "fields": fields},
+                headers=headers,
+            ) as response:
+                if response.status == 200:
+                    return loads(await response.read())
+                if response.status not in (429, 503):
+                    return None
+                retry_after = response.headers.get("Retry-After")
+
+        # Sleep outside the semaphore so other requests can proceed
+        await asyncio.sleep(parse_retry_after(retry_after, delay))
+        delay *= 2
+    return None
+
+
+async def _fetch_all(ids, token, fields=MESSAGE_FIELDS):
+    """
+    Fetch full messages concurrently.
+
+    Args:
+        ids: Message IDs to fetch
+        token: OAuth access token
+        fields: Partial response fields to request
+
+    Returns:
+        dict: Raw messages keyed by message ID
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    session = await get_session()
+    results = await asyncio.gather(
+        *(
+            _fetch_message(session, sem, message_id, token, fields)
+            for message_id in ids
+        ),
+        return_exceptions=True,
+    )
+    return {
+        message_id: result
+        for message_id, result in zip(ids, results)
+        if isinstance(result, dict)
+    }
+
+
+def _found_message(found, listed):
+    message = f"Found {found} emails."
+    if found < listed:
+        message += f" {listed - found} could not be retrieved."
+    return message
+
+
+def _build_query(label, query):
+    search_query = f"label:{label}"
+    if query:
+        search_query += f" {query}"
+    return search_query
 
 
 def list_emails(
     max_results: int = 10,
     query: str = "",
     label: str = "INBOX",
+    include_body: bool = True,
 ) -> dict:
     """
     List emails from Gmail.
@@ -15,14 +110,15 @@ def list_emails(
         max_results (int): Maximum number of emails to return
         query (str): Search query (Gmail search syntax)
         label (str): Gmail label to search in (default: INBOX)
+        include_body (bool): If False, only headers and snippets are fetched
 
     Returns:
         dict: Information about emails or error details
     """
     try:
-        # Get Gmail service
-        service = get_gmail_service()
-        if not service:
+        # Get Gmail credentials
+        creds = get_gmail_credentials()
+        if not creds:
             return {
                 "status": "error",
                 "message": "Failed to authenticate with Gmail. Please check credentials.",
@@ -30,16 +126,13 @@ def list_emails(
             }
 
         # Build the query
-        search_query = f"label:{label}"
-        if query:
-            search_query += f" {query}"
+        search_query = _build_query(label, query)
 
         # Get list of messages
-        results = (
-            service.users()
-            .messages()
-            .list(userId="me", q=search_query, maxResults=max_results)
-            .execute()
+        results = gmail_rest_get(
+            "messages",
+            creds.token,
+            params={"q": search_query, "maxResults": max_results},
         )
 
         messages = results.get("messages", [])
@@ -51,20 +144,57 @@ def list_emails(
                 "emails": [],
             }
 
-        # Get full message details and format them
-        emails = []
-        for msg in messages:
-            message = (
-                service.users()
-                .messages()
-                .get(userId="me", id=msg["id"], format="full")
-                .execute()
-            )
-            emails.append(format_message(message))
+        # Get full message details in batches instead of one request per message
+        fields = MESSAGE_FIELDS if include_body else HEADER_FIELDS
+        service = get_gmail_service()
+        fetched = {}
+
+        def collect(request_id, response, exception):
+            if exception is None:
+                fetched[request_id] = format_message(response, include_body, fields=fields)
+
+        if service:
+            for start in range(0, len(messages), BATCH_SIZE):
+                batch = service.new_batch_http_request(callback=collect)
+                for msg in messages[start:start + BATCH_SIZE]:
+                    batch.add(
+                        service.users()
+                        .messages()
+                        .get(userId="me", id=msg["id"], format="full", fields=fields),
+                        request_id=msg["id"],
+                    )
+                try:
+                    batch.execute()
+                except Exception:
+                    # Batch endpoint unavailable; these ids are fetched below
+                    pass
+
+        # Retry anything the batch endpoint failed to return
+        missing = [msg["id"] for msg in messages if msg["id"] not in fetched]
+        if len(missing) > CONCURRENT_THRESHOLD:
+            for message_id, message in run_sync(
+                _fetch_all(missing, creds.token, fields)
+            ).items():
+                fetched[message_id] = format_message(message, include_body, fields=fields)
+        else:
+            for message_id in missing:
+                try:
+                    message = gmail_rest_get(
+                        f"messages/{message_id}",
+                        creds.token,
+                        params={"format": "full", "fields": fields},
+                    )
+                except requests.RequestException:
+                    # Skipped like in the concurrent path, e.g. deleted since listing
+                    continue
+                fetched[message_id] = format_message(message, include_body, fields=fields)
+
+        # Reassemble in the order returned by the list call
+        emails = [fetched[msg["id"]] for msg in messages if msg["id"] in fetched]
 
         return {
             "status": "success",
-            "message": f"Found {len(emails)} emails.",
+            "message": _found_message(len(emails), len(messages)),
             "emails": emails,
         }
 
@@ -73,4 +203,77 @@ def list_emails(
             "status": "error",
             "message": f"Error listing emails: {str(e)}",
             "emails": [],
-        }
\ No newline at end of file
+        }
+
+
+async def alist_emails(
+    max_results: int = 10,
+    query: str = "",
+    label: str = "INBOX",
+    include_body: bool = True,
+) -> dict:
+    """
+    List emails from Gmail without blocking the event loop.
+
+    Uses direct REST calls on the shared async session, so it can run
+    concurrently with other async tools.
+
+    Args:
+        max_results (int): Maximum number of emails to return
+        query (str): Search query (Gmail search syntax)
+        label (str): Gmail label to search in (default: INBOX)
+        include_body (bool): If False, only headers and snippets are fetched
+
+    Returns:
+        dict: Information about emails or error details
+    """
+    try:
+        creds = await asyncio.to_thread(get_gmail_credentials)
+        if not creds:
+            return {
+                "status": "error",
+                "message": "Failed to authenticate with Gmail. Please check credentials.",
+                "emails": [],
+            }
+
+        # Get list of messages
+        session = await get_session()
+        async with session.get(
+            f"{GMAIL_API_URL}/messages",
+            params={"q": _build_query(label, query), "maxResults": max_results},
+            headers={"Authorization": f"Bearer {creds.token}"},
+        ) as response:
+            response.raise_for_status()
+            results = loads(await response.read())
+
+        messages = results.get("messages", [])
+
+        if not messages:
+            return {
+                "status": "success",
+                "message": "No emails found.",
+                "emails": [],
+            }
+
+        # Get full message details concurrently
+        ids = [msg["id"] for msg in messages]
+        fields = MESSAGE_FIELDS if include_body else HEADER_FIELDS
+        fetched = await _fetch_all(ids, creds.token, fields)
+        emails = [
+            format_message(fetched[i], include_body, fields=fields)
+            for i in ids
+            if i in fetched
+        ]
+
+        return {
+            "status": "success",
+            "message": _found_message(len(emails), len(ids)),
+            "emails": emails,
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error listing emails: {str(e)}",
+            "emails": [],
+        }
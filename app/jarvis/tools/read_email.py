@@ -1,6 +1,6 @@
 """Read email tool for Gmail integration."""
 
-from .email_utils import get_gmail_service, format_message
+from .email_utils import MESSAGE_FIELDS, get_gmail_credentials, gmail_rest_get, format_message
 
 
 def read_email(
@@ -16,24 +16,26 @@ def read_email(
         dict: The full email content or error details
     """
     try:
-        # Get Gmail service
-        service = get_gmail_service()
-        if not service:
+        # Get Gmail credentials
+        creds = get_gmail_credentials()
+        if not creds:
             return {
                 "status": "error",
                 "message": "Failed to authenticate with Gmail. Please check credentials.",
             }
 
-        # Get the full message
-        message = (
-            service.users()
-            .messages()
-            .get(userId="me", id=email_id, format="full")
-            .execute()
+        # Get the message, limited to the fields that are formatted
+        message = gmail_rest_get(
+            f"messages/{email_id}",
+            creds.token,
+            params={"format": "full", "fields": MESSAGE_FIELDS},
         )
 
         # Format the message
-        formatted_message = format_message(message)
+        # Reading a single email returns its whole body
+        formatted_message = format_message(
+            message, max_body_bytes=None, fields=MESSAGE_FIELDS
+        )
 
         return {
             "status": "success",
@@ -1,26 +1,46 @@
 """Send email tool for Gmail integration."""
 
-from .email_utils import get_gmail_service, create_message
+from .email_utils import get_gmail_service, get_sender_address, create_message
 
+# Gmail accepts at most 100 calls in a single batch request
+BATCH_SIZE = 100
 
-def send_email(
-    to: str,
-    subject: str,
-    body: str,
-    is_html: bool = False,
-) -> dict:
+# Keys every item passed to send_emails must have
+REQUIRED_FIELDS = ("to", "subject", "body")
+
+
+def send_emails(items: list[dict]) -> dict:
     """
-    Send an email using Gmail.
+    Send several emails using Gmail batch requests.
+
+    All items are validated and built before anything is sent. If a batch
+    fails, only that batch's emails are reported as errors; emails already
+    sent by earlier batches keep their results.
 
     Args:
-        to (str): Recipient email address
-        subject (str): Email subject
-        body (str): Email body content
-        is_html (bool): Whether the body content is HTML
+        items (list[dict]): Emails to send, each with "to", "subject", "body"
+            and optionally "is_html"
 
     Returns:
-        dict: Information about the sent email or error details
+        dict: Per-email results in the same order as items, or error details
     """
+    results = [None] * len(items)
+
+    # Reject malformed input before anything is sent
+    for index, item in enumerate(items):
+        missing = [key for key in REQUIRED_FIELDS if key not in item]
+        if missing:
+            results[index] = {
+                "status": "error",
+                "message": f"Missing {', '.join(missing)}",
+            }
+    if any(results):
+        return {
+            "status": "error",
+            "message": "Invalid emails; nothing was sent.",
+            "results": results,
+        }
+
     try:
         # Get Gmail service
         service = get_gmail_service()
@@ -28,28 +48,92 @@ def send_email(
             return {
                 "status": "error",
                 "message": "Failed to authenticate with Gmail. Please check credentials.",
+                "results": results,
             }
 
-        # Get user's email address (sender)
-        profile = service.users().getProfile(userId="me").execute()
-        sender = profile.get("emailAddress")
+        sender = get_sender_address(service)
+
+        messages = [
+            create_message(
+                sender,
+                item["to"],
+                item["subject"],
+                item["body"],
+                item.get("is_html", False),
+            )
+            for item in items
+        ]
+
+        def collect(request_id, response, exception):
+            index = int(request_id)
+            if exception is None:
+                results[index] = {"status": "success", "message_id": response["id"]}
+            else:
+                results[index] = {"status": "error", "message": str(exception)}
 
-        # Create the email message
-        message = create_message(sender, to, subject, body, is_html)
+        for start in range(0, len(items), BATCH_SIZE):
+            indexes = range(start, min(start + BATCH_SIZE, len(items)))
+            batch = service.new_batch_http_request(callback=collect)
+            for index in indexes:
+                batch.add(
+                    service.users().messages().send(userId="me", body=messages[index]),
+                    request_id=str(index),
+                )
+            try:
+                batch.execute()
+            except Exception as e:
+                for index in indexes:
+                    if results[index] is None:
+                        results[index] = {"status": "error", "message": str(e)}
 
-        # Send the email
-        sent_message = (
-            service.users()
-            .messages()
-            .send(userId="me", body=message)
-            .execute()
-        )
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = {"status": "error", "message": "No response from Gmail"}
 
+        sent = sum(1 for result in results if result["status"] == "success")
         return {
-            "status": "success",
-            "message": "Email sent successfully",
-            "message_id": sent_message["id"],
+            "status": "success" if sent == len(items) else "error",
+            "message": f"Sent {sent} of {len(items)} emails.",
+            "results": results,
         }
 
     except Exception as e:
-        return {"status": "error", "message": f"Error sending email: {str(e)}"}
\ No newline at end of file
+        return {
+            "status": "error",
+            "message": f"Error sending emails: {str(e)}",
+            "results": results,
+        }
+
+
+def send_email(
+    to: str,
+    subject: str,
+    body: str,
+    is_html: bool = False,
+) -> dict:
+    """
+    Send an email using Gmail.
+
+    Args:
+        to (str): Recipient email address
+        subject (str): Email subject
+        body (str): Email body content
+        is_html (bool): Whether the body content is HTML
+
+    Returns:
+        dict: Information about the sent email or error details
+    """
+    result = send_emails(
+        [{"to": to, "subject": subject, "body": body, "is_html": is_html}]
+    )
+    sent = result["results"][0]
+    if sent is None:
+        return {"status": "error", "message": result["message"]}
+    if sent["status"] != "success":
+        return {"status": "error", "message": f"Error sending email: {sent['message']}"}
+
+    return {
+        "status": "success",
+        "message": "Email sent successfully",
+        "message_id": sent["message_id"],
+    }